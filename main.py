@@ -1,13 +1,20 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import heapq
 import os
+import orjson
+import queue
+import threading
 import time
 import re
 import feedparser
 import requests
 import yfinance as yf
 from datetime import datetime as dt, timedelta, time as dtime
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dateutil import parser as date_parser
 from dateutil.tz import gettz
 from requests.adapters import HTTPAdapter, Retry
 
@@ -25,6 +32,15 @@ retries = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503,
 session.mount("https://", HTTPAdapter(max_retries=retries))
 
 ET = gettz("America/New_York")
+
+# Feed dates use abbreviated US zone names that dateutil won't resolve on
+# its own; map them once for date_parser.parse()
+US_TZINFOS = {
+    "EST": ET, "EDT": ET,
+    "CST": gettz("America/Chicago"), "CDT": gettz("America/Chicago"),
+    "MST": gettz("America/Denver"), "MDT": gettz("America/Denver"),
+    "PST": gettz("America/Los_Angeles"), "PDT": gettz("America/Los_Angeles"),
+}
 WINDOW_START = dtime(7, 0)
 WINDOW_END = dtime(20, 0)
 BRIEF_HOUR = 9
@@ -143,23 +159,24 @@ ENABLED_SECTORS = {
 
 # === BLACKLIST FILTERING ===
 # Terms to exclude from ticker detection and general filtering
-TICKER_BLACKLIST = {
-    "USD", "FOMC", "ETF", "IPO", "AI", "GDP", "CEO", "EV", "SEC", "FDA", 
+TICKER_BLACKLIST = frozenset({
+    "USD", "FOMC", "ETF", "IPO", "AI", "GDP", "CEO", "EV", "SEC", "FDA",
     "US", "UK", "EU", "NYC", "LA", "SF", "DC", "PR", "CEO", "CFO", "CTO",
     "COVID", "COVID-19", "NASDAQ", "NYSE", "DOW", "SPY", "QQQ", "VIX"
-}
+})
 
 # General terms to exclude from processing
-GENERAL_BLACKLIST = {
+GENERAL_BLACKLIST = frozenset({
     "advertisement", "sponsored", "promotion", "click here", "subscribe",
     "newsletter", "unsubscribe", "privacy policy", "terms of service"
-}
+})
 
 # === VOLUME FILTERING ===
 # Only process stocks with sufficient trading volume (requires yfinance)
 ENABLE_VOLUME_FILTERING = False        # Enable volume-based filtering
 MIN_AVERAGE_VOLUME = 1000000          # Minimum average daily volume
 VOLUME_CHECK_PERIOD_DAYS = 30         # Days to check for average volume
+VOLUME_CACHE_TTL_SECONDS = 86400      # Reuse a ticker's volume verdict for a day
 
 # === BREAKING NEWS INDICATORS ===
 BREAKING_NEWS_KEYWORDS = {
@@ -211,50 +228,99 @@ ALL_KEYWORDS = BULLISH + BEARISH
 
 # Regex patterns
 TICKER_REGEX = re.compile(r"\\$([A-Z]{1,5})|\\(([A-Z]{1,5})\\)")
+UPPER_WORD_RE = re.compile(r"\b[A-Z]{1,5}\b", re.ASCII)  # ASCII \b: cheaper, tickers are ASCII
 BLACKLIST = TICKER_BLACKLIST
 
-sent_global = set()
+# Enabled keyword sets prebuilt as lowercase tuples so the scorers read
+# them directly instead of re-filtering the config dicts on every headline
+BULLISH_LC = tuple(k.lower() for k in BULLISH)
+BEARISH_LC = tuple(k.lower() for k in BEARISH)
+EARNINGS_LC = tuple(k.lower() for k, v in EARNINGS_KEYWORDS.items() if v)
+BREAKING_LC = tuple(k.lower() for k, v in BREAKING_NEWS_KEYWORDS.items() if v)
+GENERAL_BLACKLIST_LC = tuple(t.lower() for t in GENERAL_BLACKLIST)
+
+# Combined keyword scanner - one compiled alternation over every enabled
+# keyword (blacklist terms included) so the scan loop does a single linear
+# pass per headline instead of one str.count()/substring scan per keyword
+SCAN_KEYWORDS = sorted(
+    set(BULLISH_LC + BEARISH_LC + EARNINGS_LC + BREAKING_LC + GENERAL_BLACKLIST_LC),
+    key=len, reverse=True  # longest-first so prefixes don't shadow longer keywords
+)
+KEYWORD_SCAN_RE = re.compile("|".join(re.escape(k) for k in SCAN_KEYWORDS))
+
+
+def scan_keywords(tl):
+    """Count keyword occurrences in a lowercased title with one regex pass"""
+    return Counter(KEYWORD_SCAN_RE.findall(tl))
+
+SENT_CACHE_MAX = 10000                 # Cap on remembered (title, link) keys
+sent_global = OrderedDict()
 ticker_sector_cache = {}
+volume_cache = {}                      # ticker -> (verdict, expires_epoch)
+feed_meta = {}                         # url -> (etag, modified) for conditional GET
+
+
+def mark_sent(key):
+    """Record a sent article, evicting the oldest entries past the cap
+
+    Keys are stored as 64-bit hashes rather than (title, link) string
+    tuples - the cache is in-process only, so hash randomization across
+    restarts doesn't matter, and entries shrink from ~200 bytes to 8.
+    """
+    h = hash(key)
+    sent_global[h] = None
+    sent_global.move_to_end(h)
+    while len(sent_global) > SENT_CACHE_MAX:
+        sent_global.popitem(last=False)
 
 
 def clean(text):
     """Clean text by removing newlines and extra whitespace"""
     return text.replace("\n", " ").strip()
 
-def extract_ticker(title):
-    """Extract stock ticker from headline with configurable filtering"""
+def extract_ticker(title, _rx=TICKER_REGEX, _upper=UPPER_WORD_RE, _bl=TICKER_BLACKLIST):
+    """Extract stock ticker from headline with configurable filtering
+
+    The defaults bind the module-level regexes and blacklist as locals
+    (LOAD_FAST instead of LOAD_GLOBAL) - this runs for every headline.
+    """
     if not ENABLE_TICKER_FILTERING:
         return "UNKNOWN"  # Return placeholder if ticker filtering disabled
-    
+
     # Try explicit ticker format first ($TICKER or (TICKER))
-    m = TICKER_REGEX.search(title)
+    m = _rx.search(title)
     if m:
         t = (m.group(1) or m.group(2)).upper()
-        if (MIN_TICKER_LENGTH <= len(t) <= MAX_TICKER_LENGTH and 
-            (not ENABLE_BLACKLIST_FILTERING or t not in TICKER_BLACKLIST)):
+        if (MIN_TICKER_LENGTH <= len(t) <= MAX_TICKER_LENGTH and
+            (not ENABLE_BLACKLIST_FILTERING or t not in _bl)):
             return t
-    
-    # Try casual ticker detection if enabled
+
+    # Try casual ticker detection if enabled - precompiled regex, lazy
+    # finditer so we stop at the first acceptable word
     if ALLOW_CASUAL_TICKER_DETECTION:
-        for w in re.findall(r"\b[A-Z]{1,5}\b", title):
-            if (MIN_TICKER_LENGTH <= len(w) <= MAX_TICKER_LENGTH and 
-                (not ENABLE_BLACKLIST_FILTERING or w not in TICKER_BLACKLIST)):
-                return w
-    
+        return next(
+            (m.group() for m in _upper.finditer(title)
+             if MIN_TICKER_LENGTH <= len(m.group()) <= MAX_TICKER_LENGTH and
+             (not ENABLE_BLACKLIST_FILTERING or m.group() not in _bl)),
+            None)
+
     return None
 
 def classify_sentiment(title):
     """Classify sentiment with configurable keyword sets and thresholds"""
+    return _classify_sentiment_lc(title.lower())
+
+def _classify_sentiment_lc(tl):
+    """classify_sentiment for a title that is already lowercased"""
+    return _classify_sentiment_cnt(scan_keywords(tl))
+
+def _classify_sentiment_cnt(cnt):
+    """classify_sentiment from a precomputed keyword Counter"""
     if not ENABLE_SENTIMENT_FILTERING:
         return "NEUTRAL"
-    
-    tl = title.lower()
-    
-    # Count enabled bullish keywords
-    bullish_count = sum(tl.count(w) for w in BULLISH_KEYWORDS.keys() if BULLISH_KEYWORDS[w])
-    
-    # Count enabled bearish keywords  
-    bearish_count = sum(tl.count(w) for w in BEARISH_KEYWORDS.keys() if BEARISH_KEYWORDS[w])
+
+    bullish_count = sum(cnt[w] for w in BULLISH_LC)
+    bearish_count = sum(cnt[w] for w in BEARISH_LC)
     
     # Apply sentiment threshold if enabled
     if ENABLE_SENTIMENT_THRESHOLD:
@@ -275,29 +341,29 @@ def classify_sentiment(title):
 
 def importance_score(title, ticker=None):
     """Calculate importance score with configurable weights and bonuses"""
+    return _importance_score_lc(title.lower(), ticker)
+
+def _importance_score_lc(tl, ticker=None):
+    """importance_score for a title that is already lowercased"""
+    return _importance_score_cnt(scan_keywords(tl), ticker)
+
+def _importance_score_cnt(cnt, ticker=None):
+    """importance_score from a precomputed keyword Counter"""
     if not ENABLE_IMPORTANCE_FILTERING:
         return 1  # Return minimum score if filtering disabled
-    
-    tl = title.lower()
+
     score = 0
-    
+
     # Base sentiment scoring with configurable weights
-    for w in BULLISH_KEYWORDS.keys():
-        if BULLISH_KEYWORDS[w]:
-            score += tl.count(w) * BULLISH_KEYWORD_WEIGHT
-    
-    for w in BEARISH_KEYWORDS.keys():
-        if BEARISH_KEYWORDS[w]:
-            score += tl.count(w) * BEARISH_KEYWORD_WEIGHT
-    
+    score += sum(cnt[w] for w in BULLISH_LC) * BULLISH_KEYWORD_WEIGHT
+    score += sum(cnt[w] for w in BEARISH_LC) * BEARISH_KEYWORD_WEIGHT
+
     # Earnings bonus
-    earnings_count = sum(tl.count(w) for w in EARNINGS_KEYWORDS.keys() if EARNINGS_KEYWORDS[w])
-    if earnings_count > 0:
+    if any(cnt[w] for w in EARNINGS_LC):
         score += EARNINGS_KEYWORD_BONUS
-    
+
     # Breaking news bonus
-    breaking_count = sum(tl.count(w) for w in BREAKING_NEWS_KEYWORDS.keys() if BREAKING_NEWS_KEYWORDS[w])
-    if breaking_count > 0:
+    if any(cnt[w] for w in BREAKING_LC):
         score += BREAKING_NEWS_BONUS
     
     # High volume stock bonus
@@ -317,36 +383,28 @@ def filter_by_length(title):
     return (MIN_HEADLINE_LENGTH <= char_count <= MAX_HEADLINE_LENGTH and
             MIN_WORD_COUNT <= word_count <= MAX_WORD_COUNT)
 
-def filter_by_time(article_date):
-    """Filter articles based on age"""
+def filter_by_time(article_date, now=None):
+    """Filter articles based on age
+
+    `now` lets the scan loop pass one timestamp for the whole cycle
+    instead of paying a tz-aware datetime.now(ET) per article.
+    """
     if not ENABLE_TIME_FILTERING:
         return True
-    
+
     if not article_date:
         return True  # If no date, allow the article
-    
-    now = dt.now(ET)
-    
+
+    if now is None:
+        now = dt.now(ET)
+
     try:
-        # Try parsing with feedparser's date parsing first
-        import feedparser
-        parsed_date = feedparser._parse_date(article_date)
-        if parsed_date:
-            article_dt = dt.fromtimestamp(parsed_date, tz=ET)
-        else:
-            # Fallback to manual parsing
-            if 'Z' in article_date:
-                article_dt = dt.fromisoformat(article_date.replace('Z', '+00:00'))
-            elif '+' in article_date or article_date.endswith('GMT'):
-                # Handle GMT format
-                article_dt = dt.strptime(article_date.replace('GMT', '').strip(), '%a, %d %b %Y %H:%M:%S')
-                article_dt = article_dt.replace(tzinfo=ET)
-            else:
-                # Try ISO format without timezone
-                article_dt = dt.fromisoformat(article_date)
-                if article_dt.tzinfo is None:
-                    article_dt = article_dt.replace(tzinfo=ET)
-    except Exception as e:
+        # dateutil handles RFC 822, ISO 8601 and everything in between in
+        # one call, replacing the old format-guessing ladder
+        article_dt = date_parser.parse(article_date, tzinfos=US_TZINFOS)
+        if article_dt.tzinfo is None:
+            article_dt = article_dt.replace(tzinfo=ET)
+    except (ValueError, OverflowError) as e:
         print(f"[DEBUG] Date parsing error for '{article_date}': {e}")
         return True  # If we can't parse the date, allow the article
     
@@ -358,11 +416,18 @@ def filter_by_time(article_date):
 
 def filter_by_blacklist(title):
     """Filter articles containing blacklisted terms"""
+    return _filter_by_blacklist_lc(title.lower())
+
+def _filter_by_blacklist_lc(tl):
+    """filter_by_blacklist for a title that is already lowercased"""
+    return _filter_by_blacklist_cnt(scan_keywords(tl))
+
+def _filter_by_blacklist_cnt(cnt):
+    """filter_by_blacklist from a precomputed keyword Counter"""
     if not ENABLE_BLACKLIST_FILTERING:
         return True
-    
-    tl = title.lower()
-    return not any(term.lower() in tl for term in GENERAL_BLACKLIST)
+
+    return not any(cnt[term] for term in GENERAL_BLACKLIST_LC)
 
 def filter_by_sector(ticker):
     """Filter articles based on company sector (placeholder for future implementation)"""
@@ -374,36 +439,97 @@ def filter_by_sector(ticker):
     return True
 
 def check_volume_filter(ticker):
-    """Check if stock meets volume requirements (requires yfinance)"""
+    """Check if stock meets volume requirements (requires yfinance)
+
+    Verdicts are cached per ticker for VOLUME_CACHE_TTL_SECONDS so the
+    same symbol showing up across scan cycles costs one yfinance call
+    per day instead of one per headline.
+    """
     if not ENABLE_VOLUME_FILTERING:
         return True
-    
+
+    now = time.time()
+    cached = volume_cache.get(ticker)
+    if cached and cached[1] > now:
+        return cached[0]
+
     try:
         stock = yf.Ticker(ticker)
         hist = stock.history(period=f"{VOLUME_CHECK_PERIOD_DAYS}d")
         if hist.empty:
-            return False
-        
-        avg_volume = hist['Volume'].mean()
-        return avg_volume >= MIN_AVERAGE_VOLUME
+            result = False
+        else:
+            result = hist['Volume'].mean() >= MIN_AVERAGE_VOLUME
+        volume_cache[ticker] = (result, now + VOLUME_CACHE_TTL_SECONDS)
+        return result
     except:
-        return True  # If we can't check volume, allow the article
-
-def send_telegram(msg, chat_id):
-    payload = {"chat_id": chat_id, "text": msg, "parse_mode": "Markdown"}
+        return True  # If we can't check volume, allow the article (uncached)
+
+# Reused payload skeleton + orjson body: only the two varying fields are
+# written per send, and serialization happens in C. Safe because only the
+# single worker thread ever touches the dict.
+_TG_HEADERS = {"Content-Type": "application/json"}
+_TG_PAYLOAD = {"chat_id": "", "text": "", "parse_mode": "Markdown"}
+
+def _send_telegram_now(msg, chat_id):
+    """Blocking Telegram send - used only by the background worker"""
+    _TG_PAYLOAD["chat_id"] = chat_id
+    _TG_PAYLOAD["text"] = msg
     try:
-        r = session.post(TG_API, json=payload, timeout=10)
+        r = session.post(TG_API, data=orjson.dumps(_TG_PAYLOAD),
+                         headers=_TG_HEADERS, timeout=10)
         print(f"[SENT] To {chat_id}: {msg.splitlines()[0]}")
     except Exception as e:
         print("[ERROR] Telegram send failed:", e)
 
+# Background sender: the scan loop queues messages and moves on instead of
+# blocking on one Telegram round trip (plus rate-limit spacing) per alert
+tg_queue = queue.Queue()
+_tg_last_send = {}  # chat_id -> monotonic time of last send to that chat
+
+def _tg_worker():
+    # Telegram's flood limit is per chat (~1 msg/s sustained), so pace each
+    # chat independently instead of inserting a flat 1s gap between every
+    # message - sends to different chats no longer wait on each other
+    while True:
+        msg, chat_id = tg_queue.get()
+        wait = 1.0 - (time.monotonic() - _tg_last_send.get(chat_id, 0.0))
+        if wait > 0:
+            time.sleep(wait)
+        _send_telegram_now(msg, chat_id)
+        _tg_last_send[chat_id] = time.monotonic()
+        tg_queue.task_done()
+
+threading.Thread(target=_tg_worker, daemon=True).start()
+
+def send_telegram(msg, chat_id):
+    """Queue a message for the background sender"""
+    tg_queue.put((msg, chat_id))
+
+def fetch_feed(url):
+    """Fetch one feed with a conditional GET; returns None when unchanged"""
+    etag, modified = feed_meta.get(url, (None, None))
+    feed = feedparser.parse(url, etag=etag, modified=modified)
+    if getattr(feed, "status", None) == 304:
+        return None
+    feed_meta[url] = (getattr(feed, "etag", None), getattr(feed, "modified", None))
+    return feed
+
 def scan_feed_list(feed_list):
     """Scan RSS feeds and apply comprehensive filtering"""
     items = []
     processed_count = 0
-    
-    for url in feed_list:
-        feed = feedparser.parse(url)
+    scan_now = dt.now(ET)  # one timestamp for the whole cycle
+
+    # Fetch every feed concurrently - one scan costs the slowest feed's
+    # round trip instead of the sum of all of them
+    with ThreadPoolExecutor(max_workers=len(feed_list)) as ex:
+        parsed = list(ex.map(fetch_feed, feed_list))
+
+    for url, feed in zip(feed_list, parsed):
+        if feed is None:
+            print(f"[FEED] {url} unchanged (304)")
+            continue
         print(f"[FEED] {url} entries: {len(feed.entries)}")
         
         feed_items_processed = 0
@@ -419,22 +545,26 @@ def scan_feed_list(feed_list):
             # Skip if no title
             if not title:
                 continue
-            
-            # Check for duplicates
-            key = (title, link)
-            if ENABLE_DUPLICATE_FILTERING and key in sent_global:
+
+            # Check for duplicates (hashed keys, see mark_sent)
+            if ENABLE_DUPLICATE_FILTERING and hash((title, link)) in sent_global:
                 continue
-            
+
+            # Lowercase and scan for keywords once; the blacklist filter,
+            # sentiment classifier and scorer below all share the Counter
+            tl = title.lower()
+            cnt = scan_keywords(tl)
+
             # Apply length filtering
             if not filter_by_length(title):
                 continue
-            
+
             # Apply time filtering
-            if article_date and not filter_by_time(article_date):
+            if article_date and not filter_by_time(article_date, scan_now):
                 continue
-            
+
             # Apply blacklist filtering
-            if not filter_by_blacklist(title):
+            if not _filter_by_blacklist_cnt(cnt):
                 continue
             
             # Extract ticker
@@ -451,12 +581,12 @@ def scan_feed_list(feed_list):
                 continue
             
             # Classify sentiment
-            sentiment = classify_sentiment(title)
+            sentiment = _classify_sentiment_cnt(cnt)
             if ENABLE_SENTIMENT_FILTERING and sentiment == "NEUTRAL":
                 continue
-            
+
             # Calculate importance score
-            score = importance_score(title, ticker)
+            score = _importance_score_cnt(cnt, ticker)
             if ENABLE_IMPORTANCE_FILTERING and score < MIN_IMPORTANCE_SCORE:
                 continue
             
@@ -472,31 +602,39 @@ def scan_feed_list(feed_list):
     print(f"[FILTER] Processed {processed_count} articles from {len(feed_list)} feeds")
     return items
 
+TG_MESSAGE_CHAR_BUDGET = 4000          # Stay under Telegram's 4096-char cap
+
+def send_alert_batch(items, chat_id):
+    """Send a batch of alerts as one message per ~4000 chars instead of one
+    POST per alert"""
+    buf, size = [], 0
+    for score, sentiment, title, ticker, link in items:
+        part = f"*{sentiment}* ${ticker}\n{title}\n{link}"
+        if buf and size + len(part) + 2 > TG_MESSAGE_CHAR_BUDGET:
+            send_telegram("\n\n".join(buf), chat_id)
+            buf, size = [], 0
+        buf.append(part)
+        size += len(part) + 2
+        mark_sent((title, link))
+    if buf:
+        send_telegram("\n\n".join(buf), chat_id)
+
 def send_top_alerts():
     market_items = scan_feed_list(FEEDS_MARKET)
     biotech_items = scan_feed_list(FEEDS_BIOTECH)
 
-    market_items.sort(key=lambda x: x[0], reverse=True)
-    biotech_items.sort(key=lambda x: x[0], reverse=True)
-
-    top_market = market_items[:5]
-    top_biotech = biotech_items[:5]
+    # Partial top-k instead of a full sort
+    top_market = heapq.nlargest(5, market_items, key=lambda x: x[0])
+    top_biotech = heapq.nlargest(5, biotech_items, key=lambda x: x[0])
 
-    for score, sentiment, title, ticker, link in top_market:
-        msg = f"*{sentiment}* ${ticker}\n{title}\n{link}"
-        send_telegram(msg, TG_MARKET)
-        sent_global.add((title, link))
-
-    for score, sentiment, title, ticker, link in top_biotech:
-        msg = f"*{sentiment}* ${ticker}\n{title}\n{link}"
-        send_telegram(msg, TG_BIOTECH)
-        sent_global.add((title, link))
+    send_alert_batch(top_market, TG_MARKET)
+    send_alert_batch(top_biotech, TG_BIOTECH)
 
 def send_morning_digest():
     """Send morning digest with configurable number of items"""
     all_items = scan_feed_list(FEEDS_MARKET + FEEDS_BIOTECH)
-    all_items.sort(key=lambda x: x[0], reverse=True)
-    top_items = all_items[:MAX_MORNING_DIGEST_ITEMS]
+    top_items = heapq.nlargest(MAX_MORNING_DIGEST_ITEMS, all_items,
+                               key=lambda x: x[0])
 
     if not top_items:
         print("[MORNING] No items found for digest")
@@ -517,6 +655,16 @@ def in_window(now):
 def is_weekday(now):
     return now.weekday() < 5  # Mon–Fri
 
+def seconds_until_window(now):
+    """Seconds until the next weekday 7am ET window opening"""
+    target = now.replace(hour=WINDOW_START.hour, minute=WINDOW_START.minute,
+                         second=0, microsecond=0)
+    if now.time() >= WINDOW_START:
+        target += timedelta(days=1)
+    while target.weekday() >= 5:
+        target += timedelta(days=1)
+    return max((target - now).total_seconds(), 60)
+
 def main():
     global BRIEF_SENT_DATE
     print("[BOOT] Stock Alert Bot running 7am–8pm ET, Mon–Fri")
@@ -533,10 +681,13 @@ def main():
                     send_top_alerts()
                 else:
                     print(f"[SLEEP] Outside trading window at {now.time()}")
-                    time.sleep(600)
+                    # Jump-sleep toward the next window opening instead of
+                    # waking every 10 minutes; capped at an hour so clock
+                    # changes are picked up
+                    time.sleep(min(seconds_until_window(now), 3600))
             else:
                 print(f"[SLEEP] Weekend ({now.strftime('%A')})")
-                time.sleep(3600)
+                time.sleep(min(seconds_until_window(now), 3600))
         except Exception as e:
             print("[ERROR] Main loop exception:", e)
         time.sleep(180)